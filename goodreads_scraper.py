@@ -4,7 +4,7 @@ import re
 import requests
 from bs4 import BeautifulSoup
 from typing import Dict, Optional
-import time
+from utils import RateLimiter
 import json
 import logging
 from urllib.parse import urlparse, urlunparse
@@ -15,6 +15,9 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.9,tr;q=0.8",
 }
 
+# Aynı süreçteki tüm veritabanları Goodreads isteklerini bu limitle paylaşır
+_RATE_LIMITER = RateLimiter(1.5)
+
 def _make_soup(html: str) -> BeautifulSoup:
     for parser in ("lxml", "html5lib", "html.parser"):
         try:
@@ -65,20 +68,9 @@ def _extract_from_json_ld(soup: BeautifulSoup) -> Dict[str, Optional[str]]:
         logging.warning(f"  ⚠️ JSON-LD parse error: {e}")
     return data
 
-def fetch_goodreads(url: str) -> Dict[str, Optional[str]]:
-    clean_url = _sanitize_url(url)
-    logging.info(f"  🔍 Goodreads'ten çekiliyor: {clean_url}")
-    time.sleep(1.5)
-
-    try:
-        res = requests.get(clean_url, headers=HEADERS, timeout=30)
-        res.raise_for_status()
-        res.encoding = 'utf-8' # Karakter kodlamasını garantile
-    except Exception as e:
-        logging.error(f"  ❌ Goodreads isteği başarısız: {e}")
-        raise
-
-    soup = _make_soup(res.text)
+def parse_goodreads_html(html: str, clean_url: str) -> Dict[str, Optional[str]]:
+    """Goodreads kitap sayfasının HTML'inden veri sözlüğünü çıkarır (ağ erişimi yok)."""
+    soup = _make_soup(html)
     data = {
         "Title": None, "Author": None, "Publisher": None, "Year Published": None,
         "Number of Pages": None, "ISBN": None, "ISBN13": None,
@@ -119,6 +111,23 @@ def fetch_goodreads(url: str) -> Dict[str, Optional[str]]:
     m = re.search(r"/book/show/(\d+)", clean_url)
     if m: data["Book Id"] = m.group(1)
 
+    return data
+
+def fetch_goodreads(url: str) -> Dict[str, Optional[str]]:
+    clean_url = _sanitize_url(url)
+    logging.info(f"  🔍 Goodreads'ten çekiliyor: {clean_url}")
+    _RATE_LIMITER.wait()
+
+    try:
+        res = requests.get(clean_url, headers=HEADERS, timeout=30)
+        res.raise_for_status()
+        res.encoding = 'utf-8' # Karakter kodlamasını garantile
+    except Exception as e:
+        logging.error(f"  ❌ Goodreads isteği başarısız: {e}")
+        raise
+
+    data = parse_goodreads_html(res.text, clean_url)
+
     found_count = sum(1 for v in data.values() if v)
     logging.info(f"  ✅ Goodreads'ten çekildi: {data['Title'] or 'BAŞLIK YOK'} ({found_count} alan dolu)")
     
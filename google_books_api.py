@@ -1,10 +1,12 @@
 # google_books_api.py
 import requests
 from typing import Dict, Optional
-import time
+from utils import RateLimiter
 import re
 import logging # Düzeltme: import ifadesi dosyanın başına taşındı
 
+_RATE_LIMITER = RateLimiter(0.5)
+
 def fetch_from_google_books(
     title: str = None, 
     author: str = None, 
@@ -25,7 +27,7 @@ def fetch_from_google_books(
     params = { "q": query, "maxResults": 5, "langRestrict": "tr" }
     
     try:
-        time.sleep(0.5)
+        _RATE_LIMITER.wait()
         res = requests.get(api_url, params=params, timeout=10)
         res.raise_for_status()
         data = res.json()
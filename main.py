@@ -1,5 +1,6 @@
 # main.py
 import sys
+import argparse
 import traceback
 import logging
 from notion_sync import run_once
@@ -15,10 +16,33 @@ def setup_logging():
         ]
     )
 
+def parse_shard(value: str):
+    """'i/N' biçimindeki shard değerini (i, N) çiftine çevirir; i 0'dan başlar."""
+    try:
+        index, count = (int(x) for x in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Geçersiz shard '{value}', beklenen biçim: i/N")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"Geçersiz shard '{value}', 0 <= i < N olmalı")
+    return index, count
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Goodreads → Notion senkronizasyonu")
+    parser.add_argument(
+        "--database", action="append", dest="database_ids", metavar="ID",
+        help="Senkronize edilecek veritabanı ID'si (birden fazla verilebilir; varsayılan: NOTION_DATABASE_IDS / NOTION_DATABASE_ID)",
+    )
+    parser.add_argument(
+        "--shard", type=parse_shard, metavar="i/N",
+        help="Sayfaları ID hash'ine göre N parçaya böler ve yalnızca i. parçayı işler (0 <= i < N)",
+    )
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = parse_args()
     setup_logging()
     try:
-        run_once()
+        run_once(database_ids=args.database_ids, shard=args.shard)
     except Exception as e:
         # En üst seviyedeki beklenmedik hataları yakala ve logla
         logging.critical(f"\n❌ PROGRAM DURDURULDU: Beklenmedik bir hata oluştu: {e}")
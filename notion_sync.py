@@ -1,27 +1,51 @@
 # notion_sync.py - ISBN Takip Çözümü
 import os
-from typing import Dict, Any, Optional
-from notion_client import Client
+import hashlib
+from itertools import zip_longest
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from notion_client import Client, APIResponseError
+from notion_client.errors import APIErrorCode
 from utils import (
-    get_env, as_title, as_rich, as_url, as_number, as_multi_select
+    get_env, as_title, as_rich, as_url, as_number, as_multi_select, as_select
 )
 from google_books_api import fetch_from_google_books
 from openlibrary_api import fetch_from_openlibrary
-from goodreads_scraper import fetch_goodreads
+from goodreads_scraper import fetch_goodreads, _sanitize_url
 from datetime import datetime, timezone, timedelta
 import logging
 
 # --- CONSTANTS ---
 NOTION_TOKEN = get_env("NOTION_TOKEN")
 DATABASE_ID = get_env("NOTION_DATABASE_ID")
+# Virgülle ayrılmış birden fazla veritabanı; tanımlıysa NOTION_DATABASE_ID yerine kullanılır
+DATABASE_IDS = get_env("NOTION_DATABASE_IDS")
 NEW_ENTRY_HOURS = int(get_env("NEW_ENTRY_HOURS", "24"))
 RECENT_EDIT_HOURS = int(get_env("RECENT_EDIT_HOURS", "24"))
 SCAN_LIMIT = get_env("SCAN_LIMIT")
 
+# Yazma başarısız olduğunda hata mesajının yazıldığı isteğe bağlı rich_text alanı
+SYNC_ERROR_PROP = "Sync Error"
+
 # --- INITIALIZATION ---
-if not NOTION_TOKEN or not DATABASE_ID:
-    raise RuntimeError("❌ NOTION_TOKEN ve NOTION_DATABASE_ID ortam değişkenleri ayarlanmalı!")
-notion = Client(auth=NOTION_TOKEN)
+_notion: Optional[Client] = None
+
+def _get_notion() -> Client:
+    """Tüm veritabanlarının paylaştığı tek Notion istemcisini döndürür."""
+    global _notion
+    if _notion is None:
+        if not NOTION_TOKEN:
+            raise RuntimeError("❌ NOTION_TOKEN ortam değişkeni ayarlanmalı!")
+        _notion = Client(auth=NOTION_TOKEN)
+    return _notion
+
+def _configured_database_ids() -> List[str]:
+    """NOTION_DATABASE_IDS (yoksa NOTION_DATABASE_ID) listesini tekrarsız döndürür."""
+    raw = DATABASE_IDS or DATABASE_ID or ""
+    ids = []
+    for db_id in (x.strip() for x in raw.split(",")):
+        if db_id and db_id not in ids:
+            ids.append(db_id)
+    return ids
 
 # --- HELPER FUNCTIONS ---
 def _get_prop_value(p: Dict[str, Any]) -> Optional[str]:
@@ -113,14 +137,45 @@ def _merge_book_data(*sources: Dict[str, Optional[str]]) -> Dict[str, Optional[s
                 merged[key] = value
     return merged
 
+def _in_shard(page_id: str, shard: Optional[Tuple[int, int]]) -> bool:
+    """
+    Sayfa bu shard'a mı ait? (index, count) çifti için sayfa ID'sinin
+    hash'ine göre bölümler; hash süreçler arasında sabittir.
+    """
+    if not shard:
+        return True
+    index, count = shard
+    digest = hashlib.sha1(page_id.replace("-", "").encode("utf-8")).hexdigest()
+    return int(digest, 16) % count == index
+
+def _round_robin(queues: List[List[Any]]):
+    """Veritabanı kuyruklarından sırayla birer öğe verir; büyük bir veritabanı diğerlerini bekletmez."""
+    for batch in zip_longest(*queues):
+        for item in batch:
+            if item is not None:
+                yield item
+
 # --- CORE DATA FETCHING ---
+# Süreç boyunca paylaşılan önbellek: aynı kitap birden fazla veritabanında olsa da bir kez çekilir
+_FETCH_CACHE: Dict[Tuple, Dict[str, Optional[str]]] = {}
+
+def _cached_fetch(fetcher: Callable[..., Dict[str, Optional[str]]], **kwargs) -> Dict[str, Optional[str]]:
+    # Boş sonuçlar (bulunamadı veya hata yutuldu) önbelleğe alınmaz; sonraki sayfa tekrar dener
+    key = (fetcher.__name__, tuple(sorted(kwargs.items())))
+    if key in _FETCH_CACHE:
+        return _FETCH_CACHE[key]
+    result = fetcher(**kwargs)
+    if result:
+        _FETCH_CACHE[key] = result
+    return result
+
 def fetch_book_data_pipeline(
     title: Optional[str], author: Optional[str], isbn: Optional[str], goodreads_url: Optional[str]
 ) -> Dict[str, Optional[str]]:
     goodreads_data, api_data = {}, {}
     if goodreads_url:
         try:
-            goodreads_data = fetch_goodreads(goodreads_url)
+            goodreads_data = _cached_fetch(fetch_goodreads, url=_sanitize_url(goodreads_url))
         except Exception as e:
             logging.warning(f"  ⚠️ Goodreads scraper hatası: {e}")
     search_title = goodreads_data.get("Title") or title
@@ -128,9 +183,11 @@ def fetch_book_data_pipeline(
     search_isbn = goodreads_data.get("ISBN13") or goodreads_data.get("ISBN") or isbn
     try:
         if search_isbn:
-            api_data = fetch_from_google_books(isbn=search_isbn) or fetch_from_openlibrary(isbn=search_isbn)
+            api_data = (_cached_fetch(fetch_from_google_books, isbn=search_isbn)
+                        or _cached_fetch(fetch_from_openlibrary, isbn=search_isbn))
         elif search_title:
-            api_data = fetch_from_google_books(title=search_title, author=search_author) or fetch_from_openlibrary(title=search_title, author=search_author)
+            api_data = (_cached_fetch(fetch_from_google_books, title=search_title, author=search_author)
+                        or _cached_fetch(fetch_from_openlibrary, title=search_title, author=search_author))
     except Exception as e:
         logging.warning(f"  ⚠️ API arama hatası: {e}")
     final_data = _merge_book_data(goodreads_data, api_data)
@@ -139,63 +196,140 @@ def fetch_book_data_pipeline(
     return final_data
 
 # --- NOTION UPDATE LOGIC ---
-def _build_updates(scraped: Dict[str, Optional[str]], current_isbn: Optional[str]) -> Dict[str, Any]:
+# Notion alanı -> (çekilen veri anahtarı, varsayılan formatlayıcı)
+_PROP_MAP = {
+    "Title": ("Title", as_title), "Author": ("Author", as_multi_select),
+    "Translator": ("Translator", as_multi_select), "goodreadsURL": ("goodreadsURL", as_url),
+    "Cover URL": ("Cover URL", as_url), "Publisher": ("Publisher", as_rich),
+    "Year Published": ("Year Published", as_number), "Original Publication Year": ("Original Publication Year", as_number),
+    "Number of Pages": ("Number of Pages", as_number), "Description": ("Description", as_rich),
+    "Language": ("Language", as_rich),
+}
+# Çekilen veriden doğrudan gelmeyen, ayrıca yazılan alanlar
+_EXTRA_PROPS = {"ISBN": as_rich, "Last Processed ISBN": as_rich, SYNC_ERROR_PROP: as_rich}
+# Veritabanında olmaması normal sayılan alanlar (uyarı verilmez)
+_OPTIONAL_PROPS = {SYNC_ERROR_PROP}
+# Değeri birebir geri okunması gereken alanlar yalnızca bu tiplerde olabilir (uyarlanmaz)
+_STRICT_PROP_TYPES = {
+    "ISBN": {"rich_text", "title"},
+    "Last Processed ISBN": {"rich_text", "title"},
+    SYNC_ERROR_PROP: {"rich_text"},
+}
+
+# Notion alan tipi -> formatlayıcı
+_FORMATTERS_BY_TYPE = {
+    "title": as_title, "rich_text": as_rich, "url": as_url,
+    "number": as_number, "multi_select": as_multi_select, "select": as_select,
+}
+
+WritePlan = Dict[str, Callable[[Optional[str]], Optional[Dict[str, Any]]]]
+
+# Veritabanı ID'si -> şemadan hesaplanmış yazma planı (çalışma başına bir kez alınır)
+_WRITE_PLAN_CACHE: Dict[str, WritePlan] = {}
+
+def _default_write_plan() -> WritePlan:
+    plan = {name: formatter for name, (_, formatter) in _PROP_MAP.items()}
+    plan.update({name: formatter for name, formatter in _EXTRA_PROPS.items() if name not in _OPTIONAL_PROPS})
+    return plan
+
+def _build_write_plan(schema_props: Dict[str, Any]) -> WritePlan:
+    """
+    Veritabanı şemasındaki gerçek tiplere göre alan -> formatlayıcı planı çıkarır.
+    Şemada olmayan veya desteklenmeyen tipteki alanlar plana alınmaz.
+    """
+    defaults = {name: formatter for name, (_, formatter) in _PROP_MAP.items()}
+    defaults.update(_EXTRA_PROPS)
+    plan = {}
+    for prop_name, default_formatter in defaults.items():
+        prop = schema_props.get(prop_name)
+        if prop is None:
+            if prop_name not in _OPTIONAL_PROPS:
+                logging.warning(f"  ⚠️ '{prop_name}' alanı veritabanında yok, yazılmayacak.")
+            continue
+        prop_type = prop.get("type")
+        allowed_types = _STRICT_PROP_TYPES.get(prop_name)
+        if allowed_types and prop_type not in allowed_types:
+            logging.warning(f"  ⚠️ '{prop_name}' alanı {prop_type} tipinde, metin olmalı; yazılmayacak.")
+            continue
+        formatter = _FORMATTERS_BY_TYPE.get(prop_type)
+        if formatter is None:
+            logging.warning(f"  ⚠️ '{prop_name}' alanının tipi ({prop_type}) desteklenmiyor, yazılmayacak.")
+            continue
+        if formatter is not default_formatter:
+            logging.info(f"  ℹ️ '{prop_name}' alanı {prop_type} tipinde, buna göre yazılacak.")
+        plan[prop_name] = formatter
+    return plan
+
+def _get_write_plan(client: Client, database_id: str) -> WritePlan:
+    """Veritabanı şemasını bir kez çeker ve yazma planını önbellekte tutar."""
+    if database_id not in _WRITE_PLAN_CACHE:
+        try:
+            schema = client.databases.retrieve(database_id=database_id)
+            _WRITE_PLAN_CACHE[database_id] = _build_write_plan(schema.get("properties", {}))
+        except Exception as e:
+            logging.warning(f"⚠️ Veritabanı şeması alınamadı ({database_id}), varsayılan alanlar kullanılacak: {e}")
+            _WRITE_PLAN_CACHE[database_id] = _default_write_plan()
+    return _WRITE_PLAN_CACHE[database_id]
+
+def _build_updates(
+    scraped: Dict[str, Optional[str]], current_isbn: Optional[str], plan: Optional[WritePlan] = None
+) -> Dict[str, Any]:
     """Tüm alanları Notion formatına çevirir ve son işlenen ISBN'i günceller."""
+    plan = plan if plan is not None else _default_write_plan()
+    values = {prop_name: scraped.get(scraped_key) for prop_name, (scraped_key, _) in _PROP_MAP.items()}
+    values["ISBN"] = scraped.get("ISBN13") or scraped.get("ISBN")
+    # Son işlenen ISBN'i kaydet
+    values["Last Processed ISBN"] = current_isbn
+
     updates = {}
-    prop_map = {
-        "Title": ("Title", as_title), "Author": ("Author", as_multi_select),
-        "Translator": ("Translator", as_multi_select), "goodreadsURL": ("goodreadsURL", as_url),
-        "Cover URL": ("Cover URL", as_url), "Publisher": ("Publisher", as_rich),
-        "Year Published": ("Year Published", as_number), "Original Publication Year": ("Original Publication Year", as_number),
-        "Number of Pages": ("Number of Pages", as_number), "Description": ("Description", as_rich),
-        "Language": ("Language", as_rich),
-    }
-    for prop_name, (scraped_key, formatter) in prop_map.items():
-        scraped_val = scraped.get(scraped_key)
-        if scraped_val:
-            formatted_value = formatter(scraped_val)
+    for prop_name, value in values.items():
+        formatter = plan.get(prop_name)
+        if value and formatter:
+            formatted_value = formatter(value)
             if formatted_value:
                 updates[prop_name] = formatted_value
-    
-    isbn_val = scraped.get("ISBN13") or scraped.get("ISBN")
-    if isbn_val:
-        updates["ISBN"] = as_rich(isbn_val)
-    
-    # Son işlenen ISBN'i kaydet
-    if current_isbn:
-        updates["Last Processed ISBN"] = as_rich(current_isbn)
-    
     return updates
 
+def _is_validation_error(error: Exception) -> bool:
+    """Hata, tekrar denemeyle düzelmeyecek bir veri/şema hatası mı? (geçici hatalar hariç)"""
+    return isinstance(error, APIResponseError) and (
+        error.code == APIErrorCode.ValidationError or error.status == 400
+    )
+
+def _flag_failed_write(client: Client, page_id: str, plan: WritePlan, current_isbn: Optional[str], error: Exception):
+    """
+    Başarısız yazmadan sonra sayfayı işaretler; böylece sonraki çalıştırmalarda
+    aynı sayfa için kaynaklar tekrar tekrar taranmaz.
+    """
+    marker = {}
+    if current_isbn and "Last Processed ISBN" in plan:
+        marker["Last Processed ISBN"] = plan["Last Processed ISBN"](current_isbn)
+    if SYNC_ERROR_PROP in plan:
+        marker[SYNC_ERROR_PROP] = plan[SYNC_ERROR_PROP](str(error))
+    marker = {k: v for k, v in marker.items() if v}
+    if not marker:
+        return
+    try:
+        client.pages.update(page_id=page_id, properties=marker)
+        logging.info(f"  🚩 Sayfa başarısız yazma olarak işaretlendi: {', '.join(marker.keys())}")
+    except Exception as e:
+        logging.warning(f"  ⚠️ Sayfa işaretlenemedi: {e}")
+
 def _update_page_cover(page_id: str, cover_url: Optional[str]):
     if not cover_url: return
     try:
-        notion.pages.update(page_id=page_id, cover={"type": "external", "external": {"url": cover_url}})
+        _get_notion().pages.update(page_id=page_id, cover={"type": "external", "external": {"url": cover_url}})
         logging.info("  📸 Kapak fotoğrafı güncellendi.")
     except Exception as e:
         logging.warning(f"  ⚠️ Kapak güncellenemedi: {e}")
 
 # --- MAIN RUNNER ---
-def run_once():
-    """
-    Notion'daki sadece şu kayıtları işler:
-    1. Yeni eklenen kayıtlar (son X saat içinde)
-    2. ISBN'i değişmiş kayıtlar (mevcut ISBN ≠ son işlenen ISBN)
-    """
-    logging.info("🚀 ISBN Takip Bazlı Senkronizasyon Başlatılıyor...")
-    logging.info("📋 Yeni kayıtlar veya ISBN'i değişmiş kayıtlar işlenecek.\n")
-    
+def _query_database(client: Client, database_id: str, limit: Optional[int]) -> Optional[List[Dict[str, Any]]]:
+    """Veritabanındaki sayfaları en yeniden eskiye çeker; hata olursa None döner."""
     sorts = [{"timestamp": "created_time", "direction": "descending"}]
-    limit = int(SCAN_LIMIT) if SCAN_LIMIT and SCAN_LIMIT.isdigit() else None
-    
-    if limit and limit > 0:
-        logging.info(f"📄 Sadece en son {limit} sayfa taranacak.")
-    else:
-        logging.info("📄 Veritabanındaki tüm sayfalar taranacak.")
-    
     all_pages = []
     start_cursor = None
-    
+
     while True:
         if limit and len(all_pages) >= limit: break
         page_size = 100
@@ -203,8 +337,8 @@ def run_once():
             remaining = limit - len(all_pages)
             if remaining < 100: page_size = remaining
         try:
-            response = notion.databases.query(
-                database_id=DATABASE_ID, 
+            response = client.databases.query(
+                database_id=database_id, 
                 sorts=sorts, 
                 start_cursor=start_cursor, 
                 page_size=page_size
@@ -214,72 +348,137 @@ def run_once():
             if not response.get("has_more") or not results: break
             start_cursor = response.get("next_cursor")
         except Exception as e:
-            logging.error(f"❌ Notion veritabanı okunurken hata oluştu: {e}")
-            return
+            logging.error(f"❌ Notion veritabanı okunurken hata oluştu ({database_id}): {e}")
+            return None
+    return all_pages
 
-    logging.info(f"📚 Notion'dan {len(all_pages)} sayfa tarandı.\n")
-    processed_count = 0
-    skipped_count = 0
+def _should_process(page: Dict[str, Any]) -> bool:
+    props = page.get("properties", {})
+    is_new = _was_recently_created(page)
+    is_edited = _was_recently_edited(page)
+    isbn_has_changed = _isbn_changed(props)
+    needs_enrich = _needs_enrichment(props)
 
-    for idx, page in enumerate(all_pages, 1):
-        props = page.get("properties", {})
-        page_id = page["id"]
-        
-        is_new = _was_recently_created(page)
-        is_edited = _was_recently_edited(page)
-        isbn_has_changed = _isbn_changed(props)
-        needs_enrich = _needs_enrichment(props)
-
-        # MANTIK: Yeni VEYA (düzenlenmiş VE ISBN değişmiş) VEYA (yeni ve eksik alanlar var)
-        if not is_new and not (is_edited and isbn_has_changed):
-            # Yeni ama eksik alanlar varsa yine de işle
-            if not (is_new and needs_enrich):
-                skipped_count += 1
-                continue
-        
-        processed_count += 1
-        title = _get_prop_value(props.get("Title"))
-        gr_url = _get_prop_value(props.get("goodreadsURL"))
-        current_isbn = _get_prop_value(props.get("ISBN"))
-        display_name = title or gr_url or page_id
-        
-        logging.info(f"--- [{processed_count}] 📖: {display_name[:70]} ---")
-        
-        if is_new:
-            logging.info("  ➡️ YENİ KAYIT - Tüm veriler çekilecek.")
-        elif isbn_has_changed:
-            logging.info("  ➡️ ISBN DEĞİŞMİŞ - Yeni ISBN için veriler çekilecek.")
-        else:
-            logging.info("  ➡️ ZENGİNLEŞTİRME GEREKLİ - Eksik alanlar doldurulacak.")
-
-        scraped_data = fetch_book_data_pipeline(
-            title=title,
-            author=_get_prop_value(props.get("Author")),
-            isbn=current_isbn,
-            goodreads_url=gr_url,
-        )
-
-        if not scraped_data or not scraped_data.get("Title"):
-            logging.warning("  -> Veri bulunamadı, atlanıyor.\n")
-            continue
+    # Önceki yazması başarısız olmuş sayfa, ISBN değişene veya hata alanı temizlenene kadar atlanır
+    if _get_prop_value(props.get(SYNC_ERROR_PROP)) and not isbn_has_changed:
+        return False
+
+    # MANTIK: Yeni VEYA (düzenlenmiş VE ISBN değişmiş) VEYA (yeni ve eksik alanlar var)
+    if not is_new and not (is_edited and isbn_has_changed):
+        # Yeni ama eksik alanlar varsa yine de işle
+        if not (is_new and needs_enrich):
+            return False
+    return True
+
+def _process_page(client: Client, page: Dict[str, Any], plan: WritePlan, position: int):
+    props = page.get("properties", {})
+    page_id = page["id"]
+    title = _get_prop_value(props.get("Title"))
+    gr_url = _get_prop_value(props.get("goodreadsURL"))
+    current_isbn = _get_prop_value(props.get("ISBN"))
+    display_name = title or gr_url or page_id
+    
+    logging.info(f"--- [{position}] 📖: {display_name[:70]} ---")
+    
+    if _was_recently_created(page):
+        logging.info("  ➡️ YENİ KAYIT - Tüm veriler çekilecek.")
+    elif _isbn_changed(props):
+        logging.info("  ➡️ ISBN DEĞİŞMİŞ - Yeni ISBN için veriler çekilecek.")
+    else:
+        logging.info("  ➡️ ZENGİNLEŞTİRME GEREKLİ - Eksik alanlar doldurulacak.")
+
+    scraped_data = fetch_book_data_pipeline(
+        title=title,
+        author=_get_prop_value(props.get("Author")),
+        isbn=current_isbn,
+        goodreads_url=gr_url,
+    )
 
-        updates = _build_updates(scraped_data, current_isbn)
+    if not scraped_data or not scraped_data.get("Title"):
+        logging.warning("  -> Veri bulunamadı, atlanıyor.\n")
+        return
+
+    updates = _build_updates(scraped_data, current_isbn, plan)
+    updated_fields = [k for k in updates.keys() if k != "Last Processed ISBN"]
+
+    if not updated_fields:  # Sadece Last Processed ISBN varsa
+        logging.info("  -> Eklenecek yeni bilgi yok.\n")
+        return
+
+    # Önceki hatalı yazmadan kalan işareti temizle (plan Sync Error'u yalnızca rich_text ise içerir)
+    if SYNC_ERROR_PROP in plan and _get_prop_value(props.get(SYNC_ERROR_PROP)):
+        updates[SYNC_ERROR_PROP] = {"rich_text": []}
+    
+    try:
+        client.pages.update(page_id=page_id, properties=updates)
+        logging.info(f"  ✅ Notion güncellendi: {', '.join(updated_fields)}")
+        _update_page_cover(page_id, scraped_data.get("Cover URL"))
+        print()
+    except Exception as e:
+        logging.error(f"  ❌ Notion güncelleme hatası: {e}\n")
+        # Geçici hatalarda (rate limit, 5xx, zaman aşımı) sayfa işaretlenmez; sonraki çalıştırmada tekrar denenir
+        if _is_validation_error(e):
+            _flag_failed_write(client, page_id, plan, current_isbn, e)
 
-        if not updates or len(updates) <= 1:  # Sadece Last Processed ISBN varsa
-            logging.info("  -> Eklenecek yeni bilgi yok.\n")
+def run_once(database_ids: Optional[List[str]] = None, shard: Optional[Tuple[int, int]] = None):
+    """
+    Notion'daki sadece şu kayıtları işler:
+    1. Yeni eklenen kayıtlar (son X saat içinde)
+    2. ISBN'i değişmiş kayıtlar (mevcut ISBN ≠ son işlenen ISBN)
+
+    Birden fazla veritabanı verilirse sayfalar veritabanları arasında sırayla
+    işlenir; `shard` (index, count) verilirse yalnızca bu shard'a düşen sayfalar işlenir.
+    """
+    database_ids = database_ids or _configured_database_ids()
+    if not database_ids:
+        raise RuntimeError("❌ NOTION_DATABASE_ID veya NOTION_DATABASE_IDS ortam değişkeni ayarlanmalı!")
+    client = _get_notion()
+
+    logging.info("🚀 ISBN Takip Bazlı Senkronizasyon Başlatılıyor...")
+    logging.info("📋 Yeni kayıtlar veya ISBN'i değişmiş kayıtlar işlenecek.\n")
+    
+    limit = int(SCAN_LIMIT) if SCAN_LIMIT and SCAN_LIMIT.isdigit() else None
+    
+    if limit and limit > 0:
+        logging.info(f"📄 Her veritabanında sadece en son {limit} sayfa taranacak.")
+    else:
+        logging.info("📄 Veritabanlarındaki tüm sayfalar taranacak.")
+    if shard:
+        logging.info(f"🧩 Shard {shard[0]}/{shard[1]} işlenecek.")
+    
+    queues = []
+    scanned_count = 0
+    skipped_count = 0
+    other_shard_count = 0
+
+    for database_id in database_ids:
+        pages = _query_database(client, database_id, limit)
+        if pages is None:
             continue
-        
-        try:
-            notion.pages.update(page_id=page_id, properties=updates)
-            logging.info(f"  ✅ Notion güncellendi: {', '.join([k for k in updates.keys() if k != 'Last Processed ISBN'])}")
-            _update_page_cover(page_id, scraped_data.get("Cover URL"))
-            print()
-        except Exception as e:
-            logging.error(f"  ❌ Notion güncelleme hatası: {e}\n")
+        scanned_count += len(pages)
+        plan = _get_write_plan(client, database_id)
+        candidates = []
+        for page in pages:
+            if not _in_shard(page["id"], shard):
+                other_shard_count += 1
+            elif _should_process(page):
+                candidates.append((page, plan))
+            else:
+                skipped_count += 1
+        logging.info(f"📚 {database_id}: {len(pages)} sayfa tarandı, {len(candidates)} sayfa işlenecek.")
+        queues.append(candidates)
+
+    processed_count = 0
+    for page, plan in _round_robin(queues):
+        processed_count += 1
+        _process_page(client, page, plan, processed_count)
     
     logging.info("=" * 60)
     logging.info("✅ ISBN Takip Bazlı Senkronizasyon Tamamlandı!")
-    logging.info(f"   📊 Toplam Taranan: {len(all_pages)}")
+    logging.info(f"   🗂️  Veritabanı: {len(database_ids)}")
+    logging.info(f"   📊 Toplam Taranan: {scanned_count}")
     logging.info(f"   ✅ İşlenen: {processed_count}")
     logging.info(f"   ⏭️  Atlanan: {skipped_count}")
+    if shard:
+        logging.info(f"   🧩 Diğer shard'lara ait: {other_shard_count}")
     logging.info("=" * 60)
@@ -1,14 +1,16 @@
 # openlibrary_api.py
 import requests
 from typing import Dict, Optional
-import time
+from utils import RateLimiter
+
+_RATE_LIMITER = RateLimiter(0.5)
 
 
 def fetch_from_openlibrary(title: str = None, author: str = None, isbn: str = None) -> Dict[str, Optional[str]]:
     """OpenLibrary API'den kitap bilgisi çek"""
     
     try:
-        time.sleep(0.5)
+        _RATE_LIMITER.wait()
         
         if isbn:
             url = f"https://openlibrary.org/api/books?bibkeys=ISBN:{isbn}&format=json&jscmd=data"
@@ -1,6 +1,8 @@
 # utils.py
 import os
 import re
+import threading
+import time
 from typing import Optional, List
 
 # .env dosyası varsa yükle
@@ -49,6 +51,26 @@ def to_int(value: Optional[str]) -> Optional[int]:
     return None
 
 
+class RateLimiter:
+    """
+    Ardışık çağrılar arasında en az `min_interval` saniye bırakır.
+    Modül seviyesinde tek örnek tutulduğunda aynı süreçteki tüm
+    veritabanı senkronizasyonları aynı limiti paylaşır.
+    """
+
+    def __init__(self, min_interval: float):
+        self.min_interval = min_interval
+        self._last_call = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._last_call + self.min_interval - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            self._last_call = time.monotonic()
+
+
 # Notion tip yardımcıları
 def as_title(value: Optional[str]):
     """Notion title property formatına çevir"""
@@ -79,6 +101,16 @@ def as_number(value: Optional[str]):
     return {"number": num}
 
 
+def as_select(value: Optional[str]):
+    """Notion select property formatına çevir (virgül içeren değerlerde ilk öğe)"""
+    if not value:
+        return None
+    name = value.split(",")[0].strip()
+    if not name:
+        return None
+    return {"select": {"name": name}}
+
+
 def as_multi_select(value: Optional[str]) -> Optional[dict]:
     """
     Notion multi_select property formatına çevir.